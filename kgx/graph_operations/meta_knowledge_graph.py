@@ -117,7 +117,7 @@ class MetaKnowledgeGraph(ErrorDetecting):
 
         # internal attributes
         # For Nodes...
-        self.node_catalog: Dict[str, List[int]] = dict()
+        self.node_catalog: Dict[str, Dict[int, None]] = dict()
         self.node_stats: Dict[str, MetaKnowledgeGraph.Category] = dict()
 
         # We no longer track 'unknown' categories in meta-knowledge-graph
@@ -200,6 +200,9 @@ class MetaKnowledgeGraph(ErrorDetecting):
         # to reduce storage in the main node catalog
         _category_curie_map: List[str] = list()
 
+        # reverse index of the 'category map', from curie string to 'cid'
+        _category_curie_to_cid: Dict[str, int] = dict()
+
         def __init__(self, category_curie: str, mkg):
             """
             MetaKnowledgeGraph.Category constructor.
@@ -216,7 +219,10 @@ class MetaKnowledgeGraph(ErrorDetecting):
             self.category_curie = category_curie
             self.mkg = mkg
 
-            if self.category_curie not in self._category_curie_map:
+            self._cid: int = self._category_curie_to_cid.setdefault(
+                self.category_curie, len(self._category_curie_map)
+            )
+            if self._cid == len(self._category_curie_map):
                 self._category_curie_map.append(self.category_curie)
             self.category_stats: Dict[str, Any] = dict()
             self.category_stats["id_prefixes"] = set()
@@ -232,14 +238,14 @@ class MetaKnowledgeGraph(ErrorDetecting):
             """
             return self.category_curie
 
-        def get_cid(self):
+        def get_cid(self) -> int:
             """
             Returns
             -------
             int
                 Internal MetaKnowledgeGraph index id for tracking a Category.
             """
-            return self._category_curie_map.index(self.category_curie)
+            return self._cid
 
         @classmethod
         def get_category_curie_from_index(cls, cid: int) -> str:
@@ -392,8 +398,7 @@ class MetaKnowledgeGraph(ErrorDetecting):
             category_record = self.node_stats[category_curie]
 
             category_idx: int = category_record.get_cid()
-            if category_idx not in self.node_catalog[n]:
-                self.node_catalog[n].append(category_idx)
+            self.node_catalog[n][category_idx] = None
 
             category_record.analyse_node_category(n, data)
 
@@ -423,7 +428,7 @@ class MetaKnowledgeGraph(ErrorDetecting):
             )
             return
         else:
-            self.node_catalog[n] = list()
+            self.node_catalog[n] = dict()
 
         if "category" not in data or not data["category"]:
             # we now simply exclude nodes with missing categories from the count, since a category
@@ -575,13 +580,22 @@ class MetaKnowledgeGraph(ErrorDetecting):
             self.predicates[predicate] -= 1
             return
 
+        # index the 'category map' directly, rather than calling
+        # Category.get_category_curie_from_index() for every cid
+        category_curie_map = self.Category._category_curie_map
+
+        # the object categories are the same for every subject category
+        object_categories: Optional[List[str]] = None
+        if v in self.node_catalog:
+            object_categories = [
+                category_curie_map[obj_cat_idx] for obj_cat_idx in self.node_catalog[v]
+            ]
+
         for subj_cat_idx in self.node_catalog[u]:
 
-            subject_category: str = self.Category.get_category_curie_from_index(
-                subj_cat_idx
-            )
+            subject_category: str = category_curie_map[subj_cat_idx]
 
-            if v not in self.node_catalog:
+            if object_categories is None:
                 error_type = ErrorType.MISSING_NODE
                 self.log_error(
                     entity=v,
@@ -592,11 +606,7 @@ class MetaKnowledgeGraph(ErrorDetecting):
                 self.predicates[predicate] -= 1
                 return
 
-            for obj_cat_idx in self.node_catalog[v]:
-                object_category: str = self.Category.get_category_curie_from_index(
-                    obj_cat_idx
-                )
-
+            for object_category in object_categories:
                 self._process_triple(subject_category, predicate, object_category, data)
 
     def get_number_of_categories(self) -> int:
@@ -857,8 +867,9 @@ class MetaKnowledgeGraph(ErrorDetecting):
         Dict
             The node stats
         """
+        analyse_node = self.analyse_node
         for n, data in graph.nodes(data=True):
-            self.analyse_node(n, data)
+            analyse_node(n, data)
         return self.get_node_stats()
 
     def summarize_graph_edges(self, graph: BaseGraph) -> List[Dict]:
@@ -876,8 +887,9 @@ class MetaKnowledgeGraph(ErrorDetecting):
             The edge stats
 
         """
+        analyse_edge = self.analyse_edge
         for u, v, k, data in graph.edges(keys=True, data=True):
-            self.analyse_edge(u, v, k, data)
+            analyse_edge(u, v, k, data)
         return self.get_edge_stats()
 
     def summarize_graph(self, graph: BaseGraph, name: str = None, **kwargs) -> Dict:
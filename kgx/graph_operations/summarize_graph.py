@@ -1,12 +1,14 @@
 """
 Classical KGX graph summary module.
 """
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set
 
 import re
+import sys
+from collections import Counter
 
 import yaml
-from json import dump
+from json import dumps
 from json.encoder import JSONEncoder
 
 from deprecation import deprecated
@@ -16,6 +18,9 @@ from kgx.utils.kgx_utils import GraphEntityType
 from kgx.graph.base_graph import BaseGraph
 from kgx.prefix_manager import PrefixManager
 
+# libyaml's C dumper, when PyYAML was built with it
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 TOTAL_NODES = "total_nodes"
 NODE_CATEGORIES = "node_categories"
 
@@ -63,6 +68,101 @@ _category_curie_regexp = re.compile("^biolink:[A-Z][a-zA-Z]*$")
 _predicate_curie_regexp = re.compile("^biolink:[a-z][a-z_]*$")
 
 
+def _make_facet_applier(
+    facet_values: Dict[str, Set], facet_properties: Optional[List[str]]
+) -> Optional[Callable[[List[Dict], Dict], None]]:
+    """
+    Specialize the facet counting of node or edge records to the given facet properties.
+
+    Parameters
+    ----------
+    facet_values: Dict[str, Set]
+        Sets of the distinct values seen, indexed by facet property.
+    facet_properties: Optional[List[str]]
+        The properties to facet on.
+
+    Returns
+    -------
+    Optional[Callable[[List[Dict], Dict], None]]
+        A function tallying the facet values of a record into each of the given
+        entries (one dict of value counts per facet property) and into facet_values,
+        or None when there are no facet properties to count.
+
+    """
+    if not facet_properties:
+        return None
+
+    properties = tuple(facet_properties)
+
+    def apply_facets(entries: List[Dict], data: Dict):
+        for facet_property in properties:
+            if facet_property in data:
+                values = data[facet_property]
+                if not isinstance(values, list):
+                    values = [values]
+            else:
+                values = ["unknown"]
+            facet_values[facet_property].update(values)
+            for entry in entries:
+                facet_counts = entry.get(facet_property)
+                if facet_counts is None:
+                    facet_counts = entry[facet_property] = dict()
+                for value in values:
+                    facet_counts[value] = facet_counts.get(value, 0) + 1
+
+    return apply_facets
+
+
+def _compile_facet_counts(
+    facet_counts: Dict[str, Dict[str, int]]
+) -> Dict[str, Dict]:
+    """
+    Copy the facet value counts of one stats entry
+    into the {value: {"count": n}} output format.
+
+    Parameters
+    ----------
+    facet_counts: Dict[str, Dict[str, int]]
+        Value counts indexed by facet property.
+
+    Returns
+    -------
+    Dict[str, Dict]
+        The formatted facet counts.
+
+    """
+    return {
+        facet_property: {value: {"count": count} for value, count in counts.items()}
+        for facet_property, counts in facet_counts.items()
+    }
+
+
+def _compile_count_entries(
+    counts: Dict[str, int], facet_entries: Dict[str, Dict]
+) -> Dict[str, Dict]:
+    """
+    Wrap the raw tallies into the {key: {"count": n, ...}} output
+    format, together with any facet counts recorded for each key.
+
+    Parameters
+    ----------
+    counts: Dict[str, int]
+        The raw tallies.
+    facet_entries: Dict[str, Dict]
+        Facet value counts, indexed by the same keys as the tallies.
+
+    Returns
+    -------
+    Dict[str, Dict]
+        The formatted count entries.
+
+    """
+    return {
+        key: {"count": count, **_compile_facet_counts(facet_entries.get(key, {}))}
+        for key, count in counts.items()
+    }
+
+
 class GraphSummary(ErrorDetecting):
     """
     Class for generating a "classical" knowledge graph summary.
@@ -124,31 +224,62 @@ class GraphSummary(ErrorDetecting):
             COUNT_BY_ID_PREFIXES: dict(),
         }
 
+        # graph-wide node id prefix counts, tallied as each node is
+        # analysed and copied into the node stats when they are finalized
+        self._count_by_id_prefixes: Counter = Counter()
+
         self.edges_processed: bool = False
 
         self.edge_stats: Dict = {
             TOTAL_EDGES: 0,
             EDGE_PREDICATES: set(),
-            COUNT_BY_EDGE_PREDICATES: {"unknown": {"count": 0}},
-            COUNT_BY_SPO: {},
+            COUNT_BY_EDGE_PREDICATES: dict(),
+            COUNT_BY_SPO: dict(),
+        }
+
+        # raw predicate and S-P-O edge tallies, and their facet counts,
+        # kept apart from the edge stats above, which are compiled from
+        # them (without changing them) when the stats are finalized
+        self._edge_counts: Dict[str, Counter] = {
+            COUNT_BY_EDGE_PREDICATES: Counter({"unknown": 0}),
+            COUNT_BY_SPO: Counter(),
+        }
+        self._edge_facet_counts: Dict[str, Dict[str, Dict]] = {
+            COUNT_BY_EDGE_PREDICATES: dict(),
+            COUNT_BY_SPO: dict(),
         }
 
+        # distinct node and edge facet values, listed
+        # in the stats above when they are finalized
+        self._node_facet_values: Dict[str, Set] = dict()
+        self._edge_facet_values: Dict[str, Set] = dict()
+
         self.node_facet_properties: Optional[List] = node_facet_properties
         if self.node_facet_properties:
             for facet_property in self.node_facet_properties:
-                self.add_node_stat(facet_property, set())
+                self.add_node_stat(facet_property, list())
+                self._node_facet_values[facet_property] = set()
 
         self.edge_facet_properties: Optional[List] = edge_facet_properties
         if self.edge_facet_properties:
             for facet_property in self.edge_facet_properties:
-                self.edge_stats[facet_property] = set()
+                self.edge_stats[facet_property] = list()
+                self._edge_facet_values[facet_property] = set()
+
+        # facet counting specialized to the facet properties given above
+        self._apply_node_facets = _make_facet_applier(
+            self._node_facet_values, self.node_facet_properties
+        )
+        self._apply_edge_facets = _make_facet_applier(
+            self._edge_facet_values, self.edge_facet_properties
+        )
 
         self.progress_monitor: Optional[
             Callable[[GraphEntityType, List], None]
         ] = progress_monitor
 
         # internal attributes
-        self.node_catalog: Dict[str, List[int]] = dict()
+        self.node_catalog: Dict[str, Dict[int, None]] = dict()
 
         self.node_categories: Dict[str, GraphSummary.Category] = dict()
 
@@ -197,6 +328,9 @@ class GraphSummary(ErrorDetecting):
         # to reduce storage in the main node catalog
         _category_curie_map: List[str] = list()
 
+        # reverse index of the 'category map', from curie string to 'cid'
+        _category_curie_to_cid: Dict[str, int] = dict()
+
         def __init__(self, category_curie: str, summary):
 
             """
@@ -231,12 +365,19 @@ class GraphSummary(ErrorDetecting):
                 "count": 0
             }
 
-            if self.category_curie not in self._category_curie_map:
+            self._cid: int = self._category_curie_to_cid.setdefault(
+                self.category_curie, len(self._category_curie_map)
+            )
+            if self._cid == len(self._category_curie_map):
                 self._category_curie_map.append(self.category_curie)
             self.category_stats: Dict[str, Any] = dict()
             self.category_stats["count"]: int = 0
-            self.category_stats["count_by_source"]: Dict[str, int] = {"unknown": 0}
-            self.category_stats["count_by_id_prefix"]: Dict[str, int] = dict()
+            self.category_stats["count_by_source"]: Counter = Counter({"unknown": 0})
+            self.category_stats["count_by_id_prefix"]: Counter = Counter()
+
+            # node facet value counts, kept apart from the
+            # count_by_category entry until it is compiled
+            self.facet_counts: Dict[str, Dict[str, int]] = dict()
 
         def get_name(self) -> str:
             """
@@ -254,7 +395,7 @@ class GraphSummary(ErrorDetecting):
             int
                 Internal GraphSummary index id for tracking a Category.
             """
-            return self._category_curie_map.index(self.category_curie)
+            return self._cid
 
         @classmethod
         def get_category_curie_by_index(cls, cid: int) -> str:
@@ -280,14 +421,14 @@ class GraphSummary(ErrorDetecting):
             """
             return list(self.category_stats["count_by_id_prefix"].keys())
 
-        def get_count_by_id_prefixes(self):
+        def get_count_by_id_prefixes(self) -> Dict[str, int]:
             """
             Returns
             -------
-            int
+            Dict[str, int]
                 Count of nodes by id_prefixes for nodes which have this category.
             """
-            return self.category_stats["count_by_id_prefix"]
+            return dict(self.category_stats["count_by_id_prefix"])
 
         def get_count(self):
             """
@@ -299,7 +440,9 @@ class GraphSummary(ErrorDetecting):
             return self.category_stats["count"]
 
         def _capture_prefix(self, n: str):
-            prefix = PrefixManager.get_prefix(n)
+            # same classification as PrefixManager.get_prefix(), but
+            # without splitting the id again once it is known to be a CURIE
+            prefix = n.partition(":")[0] if PrefixManager.is_curie(n) else None
             if not prefix:
                 error_type = ErrorType.MISSING_NODE_CURIE_PREFIX
                 self.summary.log_error(
@@ -309,18 +452,15 @@ class GraphSummary(ErrorDetecting):
                     message_level=MessageLevel.WARNING
                 )
             else:
-                if prefix in self.category_stats["count_by_id_prefix"]:
-                    self.category_stats["count_by_id_prefix"][prefix] += 1
-                else:
-                    self.category_stats["count_by_id_prefix"][prefix] = 1
+                prefix = sys.intern(prefix)
+                self.category_stats["count_by_id_prefix"][prefix] += 1
+                self.summary._count_by_id_prefixes[prefix] += 1
 
         def _capture_knowledge_source(self, data: Dict):
             if "provided_by" in data:
+                count_by_source = self.category_stats["count_by_source"]
                 for s in data["provided_by"]:
-                    if s in self.category_stats["count_by_source"]:
-                        self.category_stats["count_by_source"][s] += 1
-                    else:
-                        self.category_stats["count_by_source"][s] = 1
+                    count_by_source[s] += 1
             else:
                 self.category_stats["count_by_source"]["unknown"] += 1
 
@@ -344,15 +484,8 @@ class GraphSummary(ErrorDetecting):
 
             self._capture_knowledge_source(data)
 
-            if summary.node_facet_properties:
-                for facet_property in summary.node_facet_properties:
-                    summary.node_stats = summary.get_facet_counts(
-                        data,
-                        summary.node_stats,
-                        COUNT_BY_CATEGORY,
-                        self.category_curie,
-                        facet_property,
-                    )
+            if summary._apply_node_facets:
+                summary._apply_node_facets([self.facet_counts], data)
 
         def json_object(self):
             """
@@ -364,8 +497,8 @@ class GraphSummary(ErrorDetecting):
             return {
                 "id_prefixes": list(self.category_stats["count_by_id_prefix"].keys()),
                 "count": self.category_stats["count"],
-                "count_by_source": self.category_stats["count_by_source"],
-                "count_by_id_prefix": self.category_stats["count_by_id_prefix"],
+                "count_by_source": dict(self.category_stats["count_by_source"]),
+                "count_by_id_prefix": dict(self.category_stats["count_by_id_prefix"]),
             }
 
     def get_category(self, category_curie: str) -> Category:
@@ -394,6 +527,11 @@ class GraphSummary(ErrorDetecting):
         # analyse them each independently...
         for category_curie in category_list:
 
+            # category (and prefix, predicate) strings recur across the
+            # whole graph, so interning them lets the stats dictionaries
+            # match keys by identity rather than by string comparison
+            category_curie = sys.intern(category_curie)
+
             if category_curie not in self.node_categories:
                 try:
                     self.node_categories[category_curie] = self.Category(
@@ -410,19 +548,9 @@ class GraphSummary(ErrorDetecting):
 
             category_record = self.node_categories[category_curie]
             category_idx: int = category_record.get_cid()
-            if category_idx not in self.node_catalog[n]:
-                self.node_catalog[n].append(category_idx)
+            self.node_catalog[n][category_idx] = None
             category_record.analyse_node_category(self, n, data)
 
-        #
-        # Moved this computation from the 'analyse_node_category() method above
-        #
-        # if self.node_facet_properties:
-        #     for facet_property in self.node_facet_properties:
-        #         self.node_stats = self.get_facet_counts(
-        #             data, self.node_stats, COUNT_BY_CATEGORY, category_curie, facet_property
-        #         )
-
     def analyse_node(self, n, data):
         """
         Analyse metadata of one graph node record.
@@ -446,7 +574,7 @@ class GraphSummary(ErrorDetecting):
             )
             return
         else:
-            self.node_catalog[n] = list()
+            self.node_catalog[n] = dict()
 
         if "category" in data and data["category"]:
             categories = data["category"]
@@ -466,7 +594,7 @@ class GraphSummary(ErrorDetecting):
 
     def _capture_predicate(self, data: Dict) -> Optional[str]:
         if "predicate" not in data:
-            self.edge_stats[COUNT_BY_EDGE_PREDICATES]["unknown"]["count"] += 1
+            self._edge_counts[COUNT_BY_EDGE_PREDICATES]["unknown"] += 1
             predicate = "unknown"
         else:
             predicate = data["predicate"]
@@ -480,39 +608,17 @@ class GraphSummary(ErrorDetecting):
                 )
                 return None
 
+            predicate = sys.intern(predicate)
             self.edge_stats[EDGE_PREDICATES].add(predicate)
-            if predicate in self.edge_stats[COUNT_BY_EDGE_PREDICATES]:
-                self.edge_stats[COUNT_BY_EDGE_PREDICATES][predicate]["count"] += 1
-            else:
-                self.edge_stats[COUNT_BY_EDGE_PREDICATES][predicate] = {"count": 1}
-
-            if self.edge_facet_properties:
-                for facet_property in self.edge_facet_properties:
-                    self.edge_stats = self.get_facet_counts(
-                        data,
-                        self.edge_stats,
-                        COUNT_BY_EDGE_PREDICATES,
-                        predicate,
-                        facet_property,
-                    )
-
-        return predicate
+            self._edge_counts[COUNT_BY_EDGE_PREDICATES][predicate] += 1
 
-    def _process_triple(
-        self, subject_category: str, predicate: str, object_category: str, data: Dict
-    ):
-        # Process the 'valid' S-P-O triple here...
-        key = f"{subject_category}-{predicate}-{object_category}"
-        if key in self.edge_stats[COUNT_BY_SPO]:
-            self.edge_stats[COUNT_BY_SPO][key]["count"] += 1
-        else:
-            self.edge_stats[COUNT_BY_SPO][key] = {"count": 1}
+            if self._apply_edge_facets:
+                predicate_facet_counts = self._edge_facet_counts[
+                    COUNT_BY_EDGE_PREDICATES
+                ].setdefault(predicate, dict())
+                self._apply_edge_facets([predicate_facet_counts], data)
 
-        if self.edge_facet_properties:
-            for facet_property in self.edge_facet_properties:
-                self.edge_stats = self.get_facet_counts(
-                    data, self.edge_stats, COUNT_BY_SPO, key, facet_property
-                )
+        return predicate
 
     def analyse_edge(self, u: str, v: str, k: str, data: Dict):
         """
@@ -549,14 +655,36 @@ class GraphSummary(ErrorDetecting):
             
             # removing from edge count
             self.edge_stats[TOTAL_EDGES] -= 1
-            self.edge_stats[COUNT_BY_EDGE_PREDICATES]["unknown"]["count"] -= 1
+            self._edge_counts[COUNT_BY_EDGE_PREDICATES]["unknown"] -= 1
             return
 
+        # index the 'category map' directly, rather than calling
+        # Category.get_category_curie_by_index() for every cid
+        category_curie_map = self.Category._category_curie_map
+
+        # the object categories are the same for every subject category
+        object_categories: Optional[List[str]] = None
+        if v in self.node_catalog:
+            object_categories = [
+                category_curie_map[obj_cat_idx] for obj_cat_idx in self.node_catalog[v]
+            ]
+
+        count_by_spo = self._edge_counts[COUNT_BY_SPO]
+
+        # the S-P-O entries of this edge, to be faceted together below
+        apply_edge_facets = self._apply_edge_facets
+        spo_facet_counts = self._edge_facet_counts[COUNT_BY_SPO]
+        spo_entries: List[Dict] = []
+
         for subj_cat_idx in self.node_catalog[u]:
 
-            subject_category = self.Category.get_category_curie_by_index(subj_cat_idx)
+            subject_category = category_curie_map[subj_cat_idx]
+
+            # the leading "subject-predicate-" part of the S-P-O
+            # key is shared by all the object categories below
+            spo_key_prefix = f"{subject_category}-{predicate}-"
 
-            if v not in self.node_catalog:
+            if object_categories is None:
                 error_type = ErrorType.MISSING_NODE
                 self.log_error(
                     entity=v,
@@ -565,24 +693,20 @@ class GraphSummary(ErrorDetecting):
                 )
                 
                 self.edge_stats[TOTAL_EDGES] -= 1
-                self.edge_stats[COUNT_BY_EDGE_PREDICATES]["unknown"]["count"] -= 1
+                self._edge_counts[COUNT_BY_EDGE_PREDICATES]["unknown"] -= 1
                 return
 
-            for obj_cat_idx in self.node_catalog[v]:
+            for object_category in object_categories:
 
-                object_category = self.Category.get_category_curie_by_index(
-                    obj_cat_idx
-                )
+                # Process the 'valid' S-P-O triple here...
+                key = spo_key_prefix + object_category
+                count_by_spo[key] += 1
 
-                self._process_triple(subject_category, predicate, object_category, data)
+                if apply_edge_facets:
+                    spo_entries.append(spo_facet_counts.setdefault(key, dict()))
 
-    def _compile_prefix_stats_by_category(self, category_curie: str):
-        for prefix in self.node_stats[COUNT_BY_ID_PREFIXES_BY_CATEGORY][category_curie]:
-            if prefix not in self.node_stats[COUNT_BY_ID_PREFIXES]:
-                self.node_stats[COUNT_BY_ID_PREFIXES][prefix] = 0
-            self.node_stats[COUNT_BY_ID_PREFIXES][prefix] += self.node_stats[
-                COUNT_BY_ID_PREFIXES_BY_CATEGORY
-            ][category_curie][prefix]
+        if apply_edge_facets and spo_entries:
+            apply_edge_facets(spo_entries, data)
 
     def _compile_category_stats(self, node_category: Category):
         category_curie = node_category.get_name()
@@ -590,17 +714,18 @@ class GraphSummary(ErrorDetecting):
         self.node_stats[COUNT_BY_CATEGORY][category_curie][
             "count"
         ] = node_category.get_count()
+        self.node_stats[COUNT_BY_CATEGORY][category_curie].update(
+            _compile_facet_counts(node_category.facet_counts)
+        )
 
-        id_prefixes = node_category.get_id_prefixes()
-        self.node_stats[NODE_ID_PREFIXES_BY_CATEGORY][category_curie] = id_prefixes
-        self.node_stats[NODE_ID_PREFIXES].update(id_prefixes)
+        self.node_stats[NODE_ID_PREFIXES_BY_CATEGORY][
+            category_curie
+        ] = node_category.get_id_prefixes()
 
         self.node_stats[COUNT_BY_ID_PREFIXES_BY_CATEGORY][
             category_curie
         ] = node_category.get_count_by_id_prefixes()
 
-        self._compile_prefix_stats_by_category(category_curie)
-
     def get_node_stats(self) -> Dict[str, Any]:
         """
         Returns
@@ -616,13 +741,13 @@ class GraphSummary(ErrorDetecting):
                 self._compile_category_stats(node_category)
 
             self.node_stats[NODE_CATEGORIES] = sorted(self.node_stats[NODE_CATEGORIES])
-            self.node_stats[NODE_ID_PREFIXES] = sorted(self.node_stats[NODE_ID_PREFIXES])
+            # the graph-wide prefix counts are tallied as each node is
+            # analysed, so the distinct prefixes are simply their keys
+            self.node_stats[NODE_ID_PREFIXES] = sorted(self._count_by_id_prefixes)
+            self.node_stats[COUNT_BY_ID_PREFIXES] = dict(self._count_by_id_prefixes)
 
-            if self.node_facet_properties:
-                for facet_property in self.node_facet_properties:
-                    self.node_stats[facet_property] = sorted(
-                        list(self.node_stats[facet_property])
-                    )
+            for facet_property, values in self._node_facet_values.items():
+                self.node_stats[facet_property] = sorted(values)
 
             if not self.node_stats[TOTAL_NODES]:
                 self.node_stats[TOTAL_NODES] = len(self.node_catalog)
@@ -657,11 +782,13 @@ class GraphSummary(ErrorDetecting):
                 list(self.edge_stats[EDGE_PREDICATES])
             )
 
-            if self.edge_facet_properties:
-                for facet_property in self.edge_facet_properties:
-                    self.edge_stats[facet_property] = sorted(
-                        list(self.edge_stats[facet_property])
-                    )
+            for count_stat in [COUNT_BY_EDGE_PREDICATES, COUNT_BY_SPO]:
+                self.edge_stats[count_stat] = _compile_count_entries(
+                    self._edge_counts[count_stat], self._edge_facet_counts[count_stat]
+                )
+
+            for facet_property, values in self._edge_facet_values.items():
+                self.edge_stats[facet_property] = sorted(values)
 
         return self.edge_stats
 
@@ -740,8 +867,9 @@ class GraphSummary(ErrorDetecting):
         Dict
             The node stats
         """
+        analyse_node = self.analyse_node
         for n, data in graph.nodes(data=True):
-            self.analyse_node(n, data)
+            analyse_node(n, data)
 
         return self.get_node_stats()
 
@@ -759,60 +887,12 @@ class GraphSummary(ErrorDetecting):
         Dict
             The edge stats
         """
+        analyse_edge = self.analyse_edge
         for u, v, k, data in graph.edges(keys=True, data=True):
-            self.analyse_edge(u, v, k, data)
+            analyse_edge(u, v, k, data)
 
         return self.get_edge_stats()
 
-    def _compile_facet_stats(
-        self, stats: Dict, x: str, y: str, facet_property: str, value: str
-    ):
-
-        if facet_property not in stats[x][y]:
-            stats[x][y][facet_property] = {}
-
-        if value in stats[x][y][facet_property]:
-            stats[x][y][facet_property][value]["count"] += 1
-        else:
-            stats[x][y][facet_property][value] = {"count": 1}
-            stats[facet_property].update([value])
-
-    def get_facet_counts(
-        self, data: Dict, stats: Dict, x: str, y: str, facet_property: str
-    ) -> Dict:
-        """
-        Facet on ``facet_property`` and record the count for ``stats[x][y][facet_property]``.
-
-        Parameters
-        ----------
-        data: dict
-            Node/edge data dictionary
-        stats: dict
-            The stats dictionary
-        x: str
-            first key
-        y: str
-            second key
-        facet_property: str
-            The property to facet on
-
-        Returns
-        -------
-        Dict
-            The stats dictionary
-
-        """
-        if facet_property in data:
-            if isinstance(data[facet_property], list):
-                for k in data[facet_property]:
-                    self._compile_facet_stats(stats, x, y, facet_property, k)
-            else:
-                k = data[facet_property]
-                self._compile_facet_stats(stats, x, y, facet_property, k)
-        else:
-            self._compile_facet_stats(stats, x, y, facet_property, "unknown")
-        return stats
-
     def save(self, file, name: str = None, file_format: str = "yaml"):
         """
         Save the current GraphSummary to a specified (open) file (device).
@@ -832,9 +912,11 @@ class GraphSummary(ErrorDetecting):
         """
         stats = self.get_graph_summary(name)
         if not file_format or file_format == "yaml":
-            yaml.dump(stats, file)
+            yaml.dump(stats, file, Dumper=_YamlDumper)
         else:
-            dump(stats, file, indent=4, default=gs_default)
+            # encode in one shot and write once, rather than
+            # streaming many small chunks to the file handle
+            file.write(dumps(stats, indent=4, default=gs_default))
 
 
 @deprecated(deprecated_in="1.5.8", details="Default is the use streaming graph_summary with inspector")
@@ -866,7 +948,7 @@ def generate_graph_stats(
         graph, graph_name, node_facet_properties, edge_facet_properties
     )
     with open(filename, "w") as gsh:
-        yaml.dump(stats, gsh)
+        yaml.dump(stats, gsh, Dumper=_YamlDumper)
 
 
 def summarize_graph(
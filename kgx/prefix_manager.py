@@ -1,14 +1,16 @@
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
 import prefixcommons.curie_util as cu
-from cachetools import LRUCache, cached
 
 from kgx.config import get_jsonld_context, get_logger
 from kgx.utils.kgx_utils import contract, expand
 
 log = get_logger()
 
+_curie_regexp = re.compile(r"^[^ <()>:]*:[^/ :]+$")
+
 
 class PrefixManager(object):
     """
@@ -101,7 +103,7 @@ class PrefixManager(object):
         """
         self.reverse_prefix_map.update(m)
 
-    @cached(LRUCache(maxsize=1024))
+    @lru_cache(maxsize=4096)
     def expand(self, curie: str, fallback: bool = True) -> str:
         """
         Expand a given CURIE to an URI, based on mappings from `prefix_map`.
@@ -120,10 +122,15 @@ class PrefixManager(object):
             A URI corresponding to the CURIE
 
         """
+        # same result as prefixcommons for a prefix found in prefix_map,
+        # without building the fallback prefix maps on every call
+        prefix, sep, reference = curie.partition(":")
+        if sep and prefix in self.prefix_map:
+            return self.prefix_map[prefix] + reference
         uri = expand(curie, [self.prefix_map], fallback)
         return uri
 
-    @cached(LRUCache(maxsize=1024))
+    @lru_cache(maxsize=4096)
     def contract(self, uri: str, fallback: bool = True) -> Optional[str]:
         """
         Contract a given URI to a CURIE, based on mappings from `prefix_map`.
@@ -144,14 +151,12 @@ class PrefixManager(object):
 
         """
         # always prioritize non-CURIE shortform
-        if self.reverse_prefix_map and uri in self.reverse_prefix_map:
-            curie = self.reverse_prefix_map[uri]
-        else:
+        curie = self.reverse_prefix_map.get(uri) if self.reverse_prefix_map else None
+        if curie is None:
             curie = contract(uri, [self.prefix_map], fallback)
         return str(curie)
 
     @staticmethod
-    @cached(LRUCache(maxsize=1024))
     def is_curie(s: str) -> bool:
         """
         Check if a given string is a CURIE.
@@ -168,13 +173,11 @@ class PrefixManager(object):
 
         """
         if isinstance(s, str):
-            m = re.match(r"^[^ <()>:]*:[^/ :]+$", s)
-            return bool(m)
+            return _curie_regexp.match(s) is not None
         else:
             return False
 
     @staticmethod
-    @cached(LRUCache(maxsize=1024))
     def is_iri(s: str) -> bool:
         """
         Check if a given string as an IRI.
@@ -196,7 +199,6 @@ class PrefixManager(object):
             return False
 
     @staticmethod
-    @cached(LRUCache(maxsize=1024))
     def has_urlfragment(s: str) -> bool:
         if "#" in s:
             return True
@@ -204,7 +206,6 @@ class PrefixManager(object):
             return False
 
     @staticmethod
-    @cached(LRUCache(maxsize=1024))
     def get_prefix(curie: str) -> Optional[str]:
         """
         Get the prefix from a given CURIE.
@@ -222,11 +223,10 @@ class PrefixManager(object):
         """
         prefix: Optional[str] = None
         if PrefixManager.is_curie(curie):
-            prefix = curie.split(":", 1)[0]
+            prefix = curie.partition(":")[0]
         return prefix
 
     @staticmethod
-    @cached(LRUCache(maxsize=1024))
     def get_reference(curie: str) -> Optional[str]:
         """
         Get the reference of a given CURIE.
@@ -244,5 +244,5 @@ class PrefixManager(object):
         """
         reference: Optional[str] = None
         if PrefixManager.is_curie(curie):
-            reference = curie.split(":", 1)[1]
+            reference = curie.partition(":")[2]
         return reference
@@ -332,3 +332,130 @@ def test_summarize_graph_inspector():
         ]
         == 16
     )
+
+
+def test_summarize_graph_non_curie_node_ids():
+    """
+    Test that node identifiers which are not CURIEs (e.g. IRIs)
+    are flagged and not counted as node identifier prefixes.
+    """
+    g = NxGraph()
+    g.add_node("HGNC:1", id="HGNC:1", category=["biolink:Gene"])
+    g.add_node(
+        "http://purl.obolibrary.org/obo/GO_0001",
+        id="http://purl.obolibrary.org/obo/GO_0001",
+        category=["biolink:BiologicalProcess"],
+    )
+    g.add_node(
+        "https://identifiers.org/x/1",
+        id="https://identifiers.org/x/1",
+        category=["biolink:Gene"],
+    )
+    g.add_node("urn:uuid:1234", id="urn:uuid:1234", category=["biolink:Gene"])
+
+    gs = GraphSummary("Test Graph Summary - Non-CURIE Node Ids")
+    node_stats = gs.summarize_graph_nodes(g)
+
+    assert node_stats[NODE_ID_PREFIXES] == ["HGNC"]
+    assert node_stats[COUNT_BY_ID_PREFIXES] == {"HGNC": 1}
+    assert node_stats[NODE_ID_PREFIXES_BY_CATEGORY]["biolink:Gene"] == ["HGNC"]
+    assert node_stats[NODE_ID_PREFIXES_BY_CATEGORY]["biolink:BiologicalProcess"] == []
+    assert "MISSING_NODE_CURIE_PREFIX" in gs.get_errors("Warning")
+
+
+def test_summarize_graph_facet_counts():
+    """
+    Test the node and edge facet counts of a graph summary.
+    """
+    g = NxGraph()
+    g.add_node(
+        "HGNC:1", id="HGNC:1", category=["biolink:Gene"], provided_by=["src1", "src2"]
+    )
+    g.add_node("HGNC:2", id="HGNC:2", category=["biolink:Gene"], provided_by="src1")
+    g.add_node("MONDO:1", id="MONDO:1", category=["biolink:Disease"])
+    g.add_edge(
+        "HGNC:1",
+        "MONDO:1",
+        edge_key="HGNC:1-biolink:related_to-MONDO:1",
+        predicate="biolink:related_to",
+        knowledge_source=["ks1", "ks2"],
+    )
+    g.add_edge(
+        "HGNC:2",
+        "MONDO:1",
+        edge_key="HGNC:2-biolink:related_to-MONDO:1",
+        predicate="biolink:related_to",
+        knowledge_source="ks1",
+    )
+    g.add_edge(
+        "HGNC:1",
+        "HGNC:2",
+        edge_key="HGNC:1-biolink:related_to-HGNC:2",
+        predicate="biolink:related_to",
+    )
+
+    gs = GraphSummary(
+        "Test Graph Summary - Facet Counts",
+        node_facet_properties=["provided_by"],
+        edge_facet_properties=["knowledge_source"],
+    )
+    node_stats = gs.summarize_graph_nodes(g)
+
+    # an edge to an object node which was not summarized above
+    g.add_edge(
+        "HGNC:2",
+        "MONDO:2",
+        edge_key="HGNC:2-biolink:related_to-MONDO:2",
+        predicate="biolink:related_to",
+        knowledge_source="ks3",
+    )
+    edge_stats = gs.summarize_graph_edges(g)
+
+    assert node_stats[COUNT_BY_CATEGORY]["biolink:Gene"]["provided_by"] == {
+        "src1": {"count": 2},
+        "src2": {"count": 1},
+    }
+    assert node_stats[COUNT_BY_CATEGORY]["biolink:Disease"]["provided_by"] == {
+        "unknown": {"count": 1}
+    }
+    assert node_stats["provided_by"] == ["src1", "src2", "unknown"]
+
+    assert edge_stats[TOTAL_EDGES] == 3
+    assert edge_stats[COUNT_BY_EDGE_PREDICATES]["biolink:related_to"] == {
+        "count": 4,
+        "knowledge_source": {
+            "ks1": {"count": 2},
+            "ks2": {"count": 1},
+            "unknown": {"count": 1},
+            "ks3": {"count": 1},
+        },
+    }
+    assert edge_stats[COUNT_BY_SPO] == {
+        "biolink:Gene-biolink:related_to-biolink:Disease": {
+            "count": 2,
+            "knowledge_source": {"ks1": {"count": 2}, "ks2": {"count": 1}},
+        },
+        "biolink:Gene-biolink:related_to-biolink:Gene": {
+            "count": 1,
+            "knowledge_source": {"unknown": {"count": 1}},
+        },
+    }
+    assert edge_stats["knowledge_source"] == ["ks1", "ks2", "ks3", "unknown"]
+
+
+def test_summarize_graph_analysis_after_stats():
+    """
+    Test that records can still be analysed after the stats were read.
+    """
+    gs = GraphSummary(
+        "Test Graph Summary - Analysis After Stats",
+        node_facet_properties=["provided_by"],
+        edge_facet_properties=["knowledge_source"],
+    )
+    gs.analyse_node("A:1", {"id": "A:1", "category": ["biolink:NamedThing"]})
+    assert gs.get_node_stats()[COUNT_BY_ID_PREFIXES] == {"A": 1}
+    gs.analyse_node("B:1", {"id": "B:1", "category": ["biolink:NamedThing"]})
+
+    gs.analyse_edge("A:1", "B:1", "A:1-B:1", {})
+    assert gs.get_edge_stats()[COUNT_BY_EDGE_PREDICATES] == {"unknown": {"count": 1}}
+    gs.analyse_edge("B:1", "A:1", "B:1-A:1", {})